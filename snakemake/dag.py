@@ -1331,26 +1331,33 @@ class DAG:
             jobs = [job]
 
         self._finished.update(jobs)
+        for j in jobs:
+            # formatted params, message and shell command can be large
+            # and are no longer needed for finished jobs
+            j.release_cached_values()
 
         updated_dag = False
         if update_dynamic:
             updated_dag = self.update_checkpoint_dependencies(jobs)
 
+        # Skip jobs that are marked as until jobs.
         depending = [
             j
             for job in jobs
+            if not self.in_until(job)
             for j in self.depending[job]
-            if not self.in_until(job) and self.needrun(j)
+            if self.needrun(j)
         ]
 
         if not updated_dag:
             # Mark depending jobs as ready.
-            # Skip jobs that are marked as until jobs.
             # This is not necessary if the DAG has been fully updated above.
             for job in depending:
                 self._n_until_ready[job] -= 1
 
-        potential_new_ready_jobs = self.update_ready(depending)
+        # a job can depend on multiple jobs of a group, but it has to be
+        # checked for readiness only once
+        potential_new_ready_jobs = self.update_ready(set(depending))
 
         for job in jobs:
             if update_dynamic and job.dynamic_output:
@@ -1419,11 +1426,18 @@ class DAG:
         # no targetfile needed for job
         newjob = self.new_job(newrule, format_wildcards=non_dynamic_wildcards)
         self.replace_job(job, newjob)
+        dynamic_wildcard_names = dynamic_wildcards.keys()
+        # Whether a rule needs an update only depends on its dynamic input.
+        # Rules are keyed by id, since rule equality ignores the input.
+        rule_needs_update = dict()
         for job_ in depending:
-            needs_update = any(
-                f.get_wildcard_names() & dynamic_wildcards.keys()
-                for f in job_.rule.dynamic_input
-            )
+            needs_update = rule_needs_update.get(id(job_.rule))
+            if needs_update is None:
+                needs_update = any(
+                    f.get_wildcard_names() & dynamic_wildcard_names
+                    for f in job_.rule.dynamic_input
+                )
+                rule_needs_update[id(job_.rule)] = needs_update
 
             if needs_update:
                 newrule_ = job_.rule.dynamic_branch(dynamic_wildcards)
@@ -1579,10 +1593,10 @@ class DAG:
     def level_bfs(self, direction, *jobs, stop=lambda job: False):
         """Perform a breadth-first traversal of the DAG, but also yield the
         level together with each job."""
-        queue = [(job, 0) for job in jobs]
+        queue = deque((job, 0) for job in jobs)
         visited = set(jobs)
         while queue:
-            job, level = queue.pop(0)
+            job, level = queue.popleft()
             if stop(job):
                 # stop criterion reached for this node
                 continue
@@ -1594,36 +1608,48 @@ class DAG:
                     visited.add(job_)
 
     def dfs(self, direction, *jobs, stop=lambda job: False, post=True):
-        """Perform depth-first traversal of the DAG."""
-        visited = set()
+        """Perform depth-first traversal of the DAG.
 
-        def _dfs(job):
-            """Inner function for DFS traversal."""
+        The traversal is iterative (with an explicit stack) in order to
+        avoid nested generators and recursion limits on deep DAGs. Each job
+        is yielded at most once, even if it is reachable via multiple paths.
+        """
+        visited = set()
+        for job in jobs:
+            if job in visited:
+                continue
+            visited.add(job)
             if stop(job):
-                return
+                continue
             if not post:
                 yield job
-            for job_ in direction[job]:
-                if not job_ in visited:
+            stack = [(job, iter(direction[job]))]
+            while stack:
+                current, children = stack[-1]
+                for job_ in children:
+                    if job_ in visited:
+                        continue
                     visited.add(job_)
-                    for j in _dfs(job_):
-                        yield j
-            if post:
-                yield job
-
-        for job in jobs:
-            for job_ in self._dfs(direction, job, visited, stop=stop, post=post):
-                yield job_
+                    if stop(job_):
+                        # stop criterion reached for this node
+                        continue
+                    if not post:
+                        yield job_
+                    stack.append((job_, iter(direction[job_])))
+                    break
+                else:
+                    # all children have been visited
+                    stack.pop()
+                    if post:
+                        yield current
 
     def new_wildcards(self, job):
         """Return wildcards that are newly introduced in this job,
         compared to its ancestors."""
         new_wildcards = set(job.wildcards.items())
-        for job_ in self.dependencies[job]:
-            if not new_wildcards:
-                return set()
-            for wildcard in job_.wildcards.items():
-                new_wildcards.discard(wildcard)
+        new_wildcards.difference_update(
+            *(job_.wildcards.items() for job_ in self.dependencies[job])
+        )
         return new_wildcards
 
     def rule2job(self, targetrule):
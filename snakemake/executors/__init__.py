@@ -433,6 +433,18 @@ class CPUExecutor(RealExecutor):
         # Zero thread jobs do not need a thread, but they occupy additional workers.
         # Hence we need to reserve additional workers for them.
         self.workers = workers + 5
+        if workflow.run_local:
+            # Group jobs occupy one worker per contained job plus one for the
+            # group itself. Reserve enough workers for the largest group job
+            # that is known upfront, such that the pool does not have to be
+            # replaced while the workflow is running. Only when running locally
+            # (i.e. not as the executor of local rules in cluster mode),
+            # groups (of jobs connected by pipes) are executed here.
+            max_group_size = max(
+                (len(job) for job in dag.get_jobs_or_groups() if job.is_group()),
+                default=0,
+            )
+            self.workers = max(self.workers, max_group_size + 1)
         self.pool = concurrent.futures.ThreadPoolExecutor(max_workers=self.workers)
 
     def run(self, job, callback=None, submit_callback=None, error_callback=None):
@@ -440,7 +452,7 @@ class CPUExecutor(RealExecutor):
 
         if job.is_group():
             # if we still don't have enough workers for this group, create a new pool here
-            missing_workers = max(len(job) - self.workers, 0)
+            missing_workers = max(len(job) + 1 - self.workers, 0)
             if missing_workers:
                 self.workers += missing_workers
                 self.pool = concurrent.futures.ThreadPoolExecutor(
@@ -493,13 +505,13 @@ class CPUExecutor(RealExecutor):
 
     def run_single_job(self, job):
         if self.use_threads or (not job.is_shadow and not job.is_run):
-            future = self.pool.submit(
-                self.cached_or_run, job, run_wrapper, *self.job_args_and_prepare(job)
-            )
+            args = (run_wrapper, *self.job_args_and_prepare(job))
         else:
             # run directive jobs are spawned into subprocesses
-            future = self.pool.submit(self.cached_or_run, job, self.spawn_job, job)
-        return future
+            args = (self.spawn_job, job)
+        # access the pool only after the job has been prepared, because
+        # it might have been replaced by the scheduler in the meantime
+        return self.pool.submit(self.cached_or_run, job, *args)
 
     def run_group_job(self, job):
         """Run a pipe group job.
@@ -510,23 +522,20 @@ class CPUExecutor(RealExecutor):
 
         futures = [self.run_single_job(j) for j in job]
 
-        while True:
-            k = 0
-            for f in futures:
-                if f.done():
-                    ex = f.exception()
-                    if ex is not None:
-                        # kill all shell commands of the other group jobs
-                        # there can be only shell commands because the
-                        # run directive is not allowed for pipe jobs
-                        for j in job:
-                            shell.kill(j.jobid)
-                        raise ex
-                    else:
-                        k += 1
-            if k == len(futures):
-                return
-            time.sleep(1)
+        # Block until all jobs are done or the first one fails, instead of
+        # polling the futures (which delays noticing the end of a group).
+        done, _ = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+        for f in done:
+            ex = f.exception()
+            if ex is not None:
+                # kill all shell commands of the other group jobs
+                # there can be only shell commands because the
+                # run directive is not allowed for pipe jobs
+                for j in job:
+                    shell.kill(j.jobid)
+                raise ex
 
     def spawn_job(self, job):
         exec_job = self.exec_job
@@ -736,7 +745,13 @@ class ClusterExecutor(RealExecutor):
 
         return os.path.join(self.tmpdir, f)
 
-    def format_job(self, pattern, job, **kwargs):
+    def job_format_args(self, job):
+        """Return the job specific arguments for formatting job patterns.
+
+        Obtaining them requires formatting the cluster config and
+        serializing the job properties. Hence, they should be determined
+        only once if multiple patterns are formatted for the same job.
+        """
         wait_for_files = []
         path = ""
         if self.assume_shared_fs:
@@ -748,13 +763,21 @@ class ClusterExecutor(RealExecutor):
             # This is necessary in order to find the pulp solver backends (e.g. coincbc).
             path = "PATH='{}':$PATH".format(os.path.dirname(sys.executable))
 
-        format_p = partial(
-            self.format_job_pattern,
-            job=job,
+        return dict(
             properties=job.properties(cluster=self.cluster_params(job)),
             latency_wait=self.latency_wait,
             wait_for_files=wait_for_files,
             path=path,
+        )
+
+    def format_job(self, pattern, job, format_args=None, **kwargs):
+        if format_args is None:
+            format_args = self.job_format_args(job)
+
+        format_p = partial(
+            self.format_job_pattern,
+            job=job,
+            **format_args,
             **kwargs,
         )
         try:
@@ -774,15 +797,19 @@ class ClusterExecutor(RealExecutor):
             "{}={}".format(var, os.environ[var]) for var in self.workflow.envvars
         )
 
+        format_args = self.job_format_args(job)
         exec_job = self.format_job(
             self.exec_job,
             job,
+            format_args=format_args,
             _quote_all=True,
             use_threads=use_threads,
             envvars=envvars,
             **kwargs,
         )
-        content = self.format_job(self.jobscript, job, exec_job=exec_job, **kwargs)
+        content = self.format_job(
+            self.jobscript, job, format_args=format_args, exec_job=exec_job, **kwargs
+        )
         logger.debug("Jobscript:\n{}".format(content))
         with open(jobscript, "w") as f:
             print(content, file=f)
@@ -1022,7 +1049,7 @@ class GenericClusterExecutor(ClusterExecutor):
         running = "running"
         if self.statuscmd is not None:
 
-            def job_status(job):
+            def job_status(job, marker_files):
                 try:
                     # this command shall return "success", "failed" or "running"
                     return (
@@ -1052,14 +1079,17 @@ class GenericClusterExecutor(ClusterExecutor):
 
         else:
 
-            def job_status(job):
-                if os.path.exists(active_job.jobfinished):
-                    os.remove(active_job.jobfinished)
-                    os.remove(active_job.jobscript)
+            def job_status(job, marker_files):
+                # Instead of checking for the marker files of each job
+                # individually, look them up in the given listing of the
+                # tmpdir that is obtained once per round.
+                if os.path.basename(job.jobfinished) in marker_files:
+                    os.remove(job.jobfinished)
+                    os.remove(job.jobscript)
                     return success
-                if os.path.exists(active_job.jobfailed):
-                    os.remove(active_job.jobfailed)
-                    os.remove(active_job.jobscript)
+                if os.path.basename(job.jobfailed) in marker_files:
+                    os.remove(job.jobfailed)
+                    os.remove(job.jobscript)
                     return failed
                 return running
 
@@ -1070,26 +1100,35 @@ class GenericClusterExecutor(ClusterExecutor):
                 active_jobs = self.active_jobs
                 self.active_jobs = list()
                 still_running = list()
+            marker_files = None
+            if active_jobs and self.statuscmd is None:
+                # The status of all jobs is determined from a single listing
+                # of the tmpdir, hence only the listing is rate limited.
+                with self.status_rate_limiter:
+                    marker_files = set(os.listdir(self.tmpdir))
             # logger.debug("Checking status of {} jobs.".format(len(active_jobs)))
             for active_job in active_jobs:
-                with self.status_rate_limiter:
-                    status = job_status(active_job)
-
-                    if status == success:
-                        active_job.callback(active_job.job)
-                    elif status == failed:
-                        self.print_job_error(
-                            active_job.job,
-                            cluster_jobid=active_job.jobid
-                            if active_job.jobid
-                            else "unknown",
-                        )
-                        self.print_cluster_job_error(
-                            active_job, self.dag.jobid(active_job.job)
-                        )
-                        active_job.error_callback(active_job.job)
-                    else:
-                        still_running.append(active_job)
+                if marker_files is None:
+                    with self.status_rate_limiter:
+                        status = job_status(active_job, marker_files)
+                else:
+                    status = job_status(active_job, marker_files)
+
+                if status == success:
+                    active_job.callback(active_job.job)
+                elif status == failed:
+                    self.print_job_error(
+                        active_job.job,
+                        cluster_jobid=active_job.jobid
+                        if active_job.jobid
+                        else "unknown",
+                    )
+                    self.print_cluster_job_error(
+                        active_job, self.dag.jobid(active_job.job)
+                    )
+                    active_job.error_callback(active_job.job)
+                else:
+                    still_running.append(active_job)
             with self.lock:
                 self.active_jobs.extend(still_running)
             sleep()
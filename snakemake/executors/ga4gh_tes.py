@@ -94,15 +94,19 @@ class TaskExecutionServiceExecutor(ClusterExecutor):
             for var in self.workflow.envvars
         )
 
+        format_args = self.job_format_args(job)
         exec_job = self.format_job(
             self.exec_job,
             job,
+            format_args=format_args,
             _quote_all=False,
             use_threads=use_threads,
             envvars=envvars,
             **kwargs
         )
-        content = self.format_job(self.jobscript, job, exec_job=exec_job, **kwargs)
+        content = self.format_job(
+            self.jobscript, job, format_args=format_args, exec_job=exec_job, **kwargs
+        )
         logger.debug("Jobscript:\n{}".format(content))
         with open(jobscript, "w") as f:
             print(content, file=f)
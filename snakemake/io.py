@@ -594,16 +594,23 @@ class _IOFile(str):
             self.remote_object.upload()
             logger.info("Finished upload.")
 
-    def prepare(self):
+    def prepare(self, created_dirs=None):
+        """Create the parent directory of the file (and the fifo for pipes).
+
+        Directories already contained in the given set created_dirs are
+        skipped, newly created ones are added to it.
+        """
         path_until_wildcard = re.split(DYNAMIC_FILL, self.file)[0]
         dir = os.path.dirname(path_until_wildcard)
-        if len(dir) > 0:
+        if len(dir) > 0 and (created_dirs is None or dir not in created_dirs):
             try:
                 os.makedirs(dir, exist_ok=True)
             except OSError as e:
                 # ignore Errno 17 "File exists" (reason: multiprocessing)
                 if e.errno != 17:
                     raise e
+            if created_dirs is not None:
+                created_dirs.add(dir)
 
         if is_flagged(self._file, "pipe"):
             os.mkfifo(self._file)
@@ -9,7 +9,7 @@ import base64
 import tempfile
 import json
 
-from collections import defaultdict
+from collections import defaultdict, ChainMap
 from itertools import chain, filterfalse
 from operator import attrgetter
 from urllib.parse import urlparse
@@ -22,7 +22,7 @@ from snakemake.io import (
     is_flagged,
     get_flag_value,
 )
-from snakemake.utils import format, listfiles
+from snakemake.utils import format, vformat, listfiles
 from snakemake.exceptions import RuleException, ProtectedOutputException, WorkflowError
 from snakemake.logging import logger
 from snakemake.common import DYNAMIC_FILL, lazy_property, get_uuid
@@ -45,6 +45,8 @@ def jobfiles(jobs, type):
 
 
 class AbstractJob:
+    __slots__ = []
+
     def is_group(self):
         raise NotImplementedError()
 
@@ -133,6 +135,10 @@ class Job(AbstractJob):
         "_attempt",
         "_group",
         "targetfile",
+        "_message",
+        "_shellcmd",
+        "is_updated",
+        "pipe_output",
     ]
 
     def __init__(
@@ -168,6 +174,8 @@ class Job(AbstractJob):
         self._conda_env_file = None
         self._conda_env = None
         self._group = None
+        self._message = None
+        self._shellcmd = None
 
         self.shadow_dir = None
         self._inputsize = None
@@ -287,10 +295,19 @@ class Job(AbstractJob):
 
     @attempt.setter
     def attempt(self, attempt):
-        # reset resources
+        # reset resources and everything that is formatted with them
         self._resources = None
+        self._message = None
+        self._shellcmd = None
         self._attempt = attempt
 
+    def release_cached_values(self):
+        """Drop lazily evaluated values that are not needed anymore once
+        the job has finished. They are recomputed if accessed again."""
+        self._params = None
+        self._message = None
+        self._shellcmd = None
+
     @property
     def resources(self):
         if self._resources is None:
@@ -381,10 +398,11 @@ class Job(AbstractJob):
     @property
     def message(self):
         """ Return the message for this job. """
+        if self._message is not None or not self.rule.message:
+            return self._message
         try:
-            return (
-                self.format_wildcards(self.rule.message) if self.rule.message else None
-            )
+            self._message = self.format_wildcards(self.rule.message)
+            return self._message
         except AttributeError as ex:
             raise RuleException(str(ex), rule=self.rule)
         except KeyError as ex:
@@ -396,12 +414,11 @@ class Job(AbstractJob):
     @property
     def shellcmd(self):
         """ Return the shell command. """
+        if self._shellcmd is not None or not self.rule.shellcmd:
+            return self._shellcmd
         try:
-            return (
-                self.format_wildcards(self.rule.shellcmd)
-                if self.rule.shellcmd
-                else None
-            )
+            self._shellcmd = self.format_wildcards(self.rule.shellcmd)
+            return self._shellcmd
         except AttributeError as ex:
             raise RuleException(str(ex), rule=self.rule)
         except KeyError as ex:
@@ -447,11 +464,14 @@ class Job(AbstractJob):
 
     @property
     def is_pipe(self):
-        return any([is_flagged(o, "pipe") for o in self.output])
+        return bool(self.pipe_output)
 
     @property
     def expanded_output(self):
         """ Iterate over output files while dynamic output is expanded. """
+        if not self.dynamic_output:
+            yield from self.output
+            return
         for f, f_ in zip(self.output, self.rule.output):
             if f in self.dynamic_output:
                 expansion = self.expand_dynamic(f_)
@@ -475,12 +495,17 @@ class Job(AbstractJob):
     @property
     def dynamic_wildcards(self):
         """ Return all wildcard values determined from dynamic output. """
-        combinations = set()
-        for f, f_ in zip(self.output, self.rule.output):
-            if f in self.dynamic_output:
-                for f, w in self.expand_dynamic(f_):
-                    combinations.add(tuple(w.items()))
         wildcards = defaultdict(list)
+        if not self.dynamic_output:
+            return wildcards
+        combinations = {
+            tuple(w.items())
+            for f, f_ in zip(self.output, self.rule.output)
+            if f in self.dynamic_output
+            for _, w in self.expand_dynamic(f_)
+        }
+        # values of all wildcards are appended per combination, so that
+        # the lists stay aligned (hence, they are not deduplicated per name)
         for combination in combinations:
             for name, value in combination:
                 wildcards[name].append(value)
@@ -704,15 +729,18 @@ class Job(AbstractJob):
 
         self.remove_existing_output()
 
-        for f, f_ in zip(self.output, self.rule.output):
-            f.prepare()
+        # outputs, logs and benchmark often share their directories,
+        # hence create each of them only once
+        created_dirs = set()
+        for f in self.output:
+            f.prepare(created_dirs)
 
         self.download_remote_input()
 
         for f in self.log:
-            f.prepare()
+            f.prepare(created_dirs)
         if self.benchmark:
-            self.benchmark.prepare()
+            self.benchmark.prepare(created_dirs)
 
         if not self.is_shadow:
             return
@@ -812,9 +840,8 @@ class Job(AbstractJob):
 
     def format_wildcards(self, string, **variables):
         """ Format a string with variables from the job. """
-        _variables = dict()
-        _variables.update(self.rule.workflow.globals)
-        _variables.update(
+        _variables = ChainMap(
+            variables,
             dict(
                 input=self.input,
                 output=self.output,
@@ -829,11 +856,13 @@ class Job(AbstractJob):
                 rule=self.rule.name,
                 rulename=self.rule.name,
                 bench_iteration=None,
-            )
+            ),
+            self.rule.workflow.globals,
+            # as for utils.format, fall back to the globals of this module
+            globals(),
         )
-        _variables.update(variables)
         try:
-            return format(string, **_variables)
+            return vformat(string, (), _variables)
         except NameError as ex:
             raise RuleException("NameError: " + str(ex), rule=self.rule)
         except IndexError as ex:
@@ -1287,9 +1316,8 @@ class GroupJob(AbstractJob):
         # remove all pipe outputs since all jobs of this group are done and the
         # pipes are no longer needed
         for job in self.jobs:
-            for f in job.output:
-                if is_flagged(f, "pipe"):
-                    f.remove()
+            for f in job.pipe_output:
+                f.remove()
 
     @property
     def name(self):
@@ -228,12 +228,15 @@ class Persistence:
         params = self._params(job)
         shellcmd = job.shellcmd
         conda_env = self._conda_env(job)
+        job_hash = hash(job)
+        container_img_url = job.container_img_url
         fallback_time = time.time()
         for f in job.expanded_output:
             rec_path = self._record_path(self._incomplete_path, f)
-            starttime = os.path.getmtime(rec_path) if os.path.exists(rec_path) else None
-            # Sometimes finished is called twice, if so, lookup the previous starttime
-            if not os.path.exists(rec_path):
+            if os.path.exists(rec_path):
+                starttime = os.path.getmtime(rec_path)
+            else:
+                # Sometimes finished is called twice, if so, lookup the previous starttime
                 starttime = self._read_record(self._metadata_path, f).get(
                     "starttime", None
                 )
@@ -251,9 +254,9 @@ class Persistence:
                     "incomplete": False,
                     "starttime": starttime,
                     "endtime": endtime,
-                    "job_hash": hash(job),
+                    "job_hash": job_hash,
                     "conda_env": conda_env,
-                    "container_img_url": job.container_img_url,
+                    "container_img_url": container_img_url,
                 },
                 f,
             )
@@ -432,12 +435,17 @@ class Persistence:
                     print(*files, sep="\n", file=lock)
                 return
 
-    def _record_path(self, subject, id):
+    @lru_cache()
+    def _max_name_len(self, subject):
         max_len = (
             os.pathconf(subject, "PC_NAME_MAX") if os.name == "posix" else 255
         )  # maximum NTFS and FAT32 filename length
         if max_len == 0:
             max_len = 255
+        return max_len
+
+    def _record_path(self, subject, id):
+        max_len = self._max_name_len(subject)
 
         b64id = self._b64id(id)
         # split into chunks of proper length
@@ -10,7 +10,7 @@ import time
 import math
 
 from functools import partial
-from collections import defaultdict
+from collections import defaultdict, Counter
 from itertools import chain, accumulate, product
 from contextlib import ContextDecorator
 
@@ -129,8 +129,12 @@ class JobScheduler:
             or cluster_sync
             or drmaa
         )
-        self._open_jobs = threading.Semaphore(0)
         self._lock = threading.Lock()
+        # signals the scheduling loop that the set of open jobs might have
+        # changed; notifications arriving before the next scheduling round
+        # are coalesced into a single wakeup
+        self._open_jobs = threading.Condition(self._lock)
+        self._wakeup = False
 
         self._errors = False
         self._finished = False
@@ -382,7 +386,7 @@ class JobScheduler:
             # If this fails, it is due to scheduler not being invoked in the main thread.
             # This can only happen with --gui, in which case it is fine for now.
             pass
-        self._open_jobs.release()
+        self._wakeup = True
 
     @property
     def stats(self):
@@ -417,13 +421,11 @@ class JobScheduler:
         """ Schedule jobs that are ready, maximizing cpu usage. """
         try:
             while True:
-                # work around so that the wait does not prevent keyboard interrupts
-                # while not self._open_jobs.acquire(False):
-                #    time.sleep(1)
-                self._open_jobs.acquire()
-
                 # obtain needrun and running jobs in a thread-safe way
                 with self._lock:
+                    while not self._wakeup:
+                        self._open_jobs.wait()
+                    self._wakeup = False
                     needrun = set(self.open_jobs)
                     running = list(self.running)
                     errors = self._errors
@@ -568,10 +570,15 @@ class JobScheduler:
                     # During dryrun, only release when all running jobs are done.
                     # This saves a lot of time, as self.open_jobs has to be
                     # evaluated less frequently.
-                    self._open_jobs.release()
+                    self._notify_open_jobs()
             else:
                 # go on scheduling if there is any free core
-                self._open_jobs.release()
+                self._notify_open_jobs()
+
+    def _notify_open_jobs(self):
+        """Wake up the scheduling loop. Has to be called with self._lock held."""
+        self._wakeup = True
+        self._open_jobs.notify()
 
     def _error(self, job):
         with self._lock:
@@ -599,12 +606,12 @@ class JobScheduler:
             self.failed.add(job)
             if self.keepgoing:
                 logger.info("Job failed, going on with independent jobs.")
-        self._open_jobs.release()
+        self._notify_open_jobs()
 
     def exit_gracefully(self, *args):
         with self._lock:
             self._user_kill = "graceful"
-        self._open_jobs.release()
+            self._notify_open_jobs()
 
     def job_selector_ilp(self, jobs):
         """
@@ -632,9 +639,8 @@ class JobScheduler:
 
             size_gb = lambda f: f.size / 1e9
 
-            temp_files = {
-                temp_file for job in jobs for temp_file in self.dag.temp_input(job)
-            }
+            temp_input = {job: set(self.dag.temp_input(job)) for job in jobs}
+            temp_files = set(chain.from_iterable(temp_input.values()))
 
             temp_job_improvement = {
                 temp_file: pulp.LpVariable(
@@ -706,16 +712,18 @@ class JobScheduler:
                 )
 
             # Choose jobs that lead to "fastest" (minimum steps) removal of existing temp file
-            remaining_jobs = self.remaining_jobs
+            # Count the remaining consumers of each temp file in a single pass over the
+            # remaining jobs instead of rescanning them for every temp file.
+            n_remaining_consumers = Counter(
+                temp_file
+                for job in self.remaining_jobs
+                for temp_file in self.dag.temp_input(job)
+                if temp_file in temp_files
+            )
             for temp_file in temp_files:
                 prob += temp_job_improvement[temp_file] <= lpSum(
-                    [
-                        scheduled_jobs[job] * self.required_by_job(temp_file, job)
-                        for job in jobs
-                    ]
-                ) / lpSum(
-                    [self.required_by_job(temp_file, job) for job in remaining_jobs]
-                )
+                    [scheduled_jobs[job] for job in jobs if temp_file in temp_input[job]]
+                ) / n_remaining_consumers[temp_file]
 
                 prob += (
                     temp_file_deletable[temp_file] <= temp_job_improvement[temp_file]
@@ -754,73 +762,49 @@ class JobScheduler:
             )
         return selected_jobs
 
-    def required_by_job(self, temp_file, job):
-        return 1 if temp_file in self.dag.temp_input(job) else 0
-
     def job_selector_greedy(self, jobs):
         """
         Using the greedy heuristic from
         "A Greedy Algorithm for the General Multidimensional Knapsack
         Problem", Akcay, Li, Xu, Annals of Operations Research, 2012
 
+        Since each job is an item with exactly one copy (0-1 MDKP), the
+        effective capacity of a job is either 0 or 1. Hence, the iterative
+        argmax of the original algorithm reduces to visiting the jobs once in
+        the order of decreasing reward and selecting each job that still fits
+        into the remaining resources (capacities only decrease, so a job that
+        does not fit at some point will never fit later on).
+
         Args:
             jobs (list):    list of jobs
         """
         with self._lock:
             if not self.resources["_cores"]:
                 return set()
-            # each job is an item with one copy (0-1 MDKP)
-            n = len(jobs)
-            x = [0] * n  # selected jobs
-            E = set(range(n))  # jobs still free to select
-            u = [1] * n
+            jobs = list(jobs)
             a = list(map(self.job_weight, jobs))  # resource usage of jobs
-            c = list(map(self.job_reward, jobs))  # job rewards
-
-            def calc_reward():
-                return [c_j * y_j for c_j, y_j in zip(c, y)]
 
             b = [
                 self.resources[name] for name in self.global_resources
             ]  # resource capacities
 
-            while True:
-                # Step 2: compute effective capacities
-                y = [
-                    (
-                        min(
-                            (min(u[j], b_i // a_j_i) if a_j_i > 0 else u[j])
-                            for b_i, a_j_i in zip(b, a[j])
-                            if a_j_i
-                        )
-                        if j in E
-                        else 0
-                    )
-                    for j in range(n)
-                ]
-                if not any(y):
-                    break
-                y = [
-                    (max(1, int(self.greediness * y_j)) if y_j > 0 else 0) for y_j in y
-                ]
-
-                # Step 3: compute rewards on cumulative sums
-                reward = calc_reward()
-                j_sel = max(E, key=reward.__getitem__)  # argmax
-
-                # Step 4: batch increment
-                y_sel = y[j_sel]
-
-                # Step 5: update information
-                x[j_sel] += y_sel
-                b = [b_i - (a_j_i * y_sel) for b_i, a_j_i in zip(b, a[j_sel])]
-                u[j_sel] -= y_sel
-                if not u[j_sel] or self.greediness == 1:
-                    E.remove(j_sel)
-                if not E:
-                    break
-
-            solution = set(job for job, sel in zip(jobs, x) if sel)
+            # total resource usage of all jobs
+            a_total = [sum(a_j[i] for a_j in a) for i in range(len(b))]
+            if all(a_total_i <= b_i for b_i, a_total_i in zip(b, a_total)):
+                # All jobs fit at once, no need to compute rewards (which
+                # requires to determine file sizes) and to select jobs.
+                solution = set(jobs)
+                b = [b_i - a_total_i for b_i, a_total_i in zip(b, a_total)]
+            else:
+                c = list(map(self.job_reward, jobs))  # job rewards
+
+                solution = set()
+                for j in sorted(range(len(jobs)), key=c.__getitem__, reverse=True):
+                    a_j = a[j]
+                    if all(a_j_i <= b_i for b_i, a_j_i in zip(b, a_j)):
+                        solution.add(jobs[j])
+                        b = [b_i - a_j_i for b_i, a_j_i in zip(b, a_j)]
+
             # update resources
             for name, b_i in zip(self.global_resources, b):
                 self.resources[name] = b_i
@@ -10,6 +10,7 @@ import inspect
 import textwrap
 import platform
 from itertools import chain
+from functools import lru_cache
 import collections
 import multiprocessing
 import string
@@ -170,13 +171,15 @@ def listfiles(pattern, restriction=None, omit_value=None):
             dirname = "."
     else:
         dirname = os.path.dirname(pattern)
-    pattern = re.compile(regex(pattern))
+    match_pattern = re.compile(regex(pattern)).match
 
+    # os.walk is based on os.scandir, hence no extra stat calls are needed here
     for dirpath, dirnames, filenames in os.walk(dirname):
+        is_cwd = dirpath == "."
         for f in chain(filenames, dirnames):
-            if dirpath != ".":
+            if not is_cwd:
                 f = os.path.normpath(os.path.join(dirpath, f))
-            match = re.match(pattern, f)
+            match = match_pattern(f)
             if match:
                 wildcards = Namedlist(fromdict=match.groupdict())
                 if restriction is not None:
@@ -287,6 +290,13 @@ def R(code):
     robjects.r(format(textwrap.dedent(code), stepout=2))
 
 
+@lru_cache(maxsize=1024)
+def _parse_format_string(format_string):
+    """Parse a format string once, since the same rule templates
+    (shell commands, messages, ...) are formatted for every job."""
+    return tuple(string.Formatter().parse(format_string))
+
+
 class SequenceFormatter(string.Formatter):
     """string.Formatter subclass with special behavior for sequences.
 
@@ -306,6 +316,9 @@ class SequenceFormatter(string.Formatter):
         self.separator = separator
         self.element_formatter = element_formatter
 
+    def parse(self, format_string):
+        return _parse_format_string(format_string)
+
     def format_element(self, elem, format_spec):
         """Format a single element
 
@@ -393,21 +406,22 @@ def format(_pattern, *args, stepout=1, _quote_all=False, **kwargs):
         frame = frame.f_back
         stepout -= 1
 
-    variables = dict(frame.f_globals)
-    # add local variables from calling rule/function
-    variables.update(frame.f_locals)
-    if "self" in variables and sys.version_info < (3, 5):
-        # self is the first arg of fmt.format as well. Not removing it would
-        # cause a multiple values error on Python <=3.4.2.
-        del variables["self"]
-    variables.update(kwargs)
+    # look up kwargs first, then local variables from the calling
+    # rule/function, then its globals, without copying any namespace
+    variables = collections.ChainMap(kwargs, frame.f_locals, frame.f_globals)
+    return vformat(_pattern, args, variables, _quote_all=_quote_all)
+
+
+def vformat(_pattern, args, variables, _quote_all=False):
+    """Format a pattern in Snakemake style with the given positional
+    arguments and mapping of variables (which is not copied)."""
     fmt = SequenceFormatter(separator=" ")
     if _quote_all:
         fmt.element_formatter = AlwaysQuotedFormatter()
     else:
         fmt.element_formatter = QuotedFormatter()
     try:
-        return fmt.format(_pattern, *args, **variables)
+        return fmt.vformat(_pattern, args, variables)
     except KeyError as ex:
         if str(ex).strip("'") in variables["wildcards"].keys():
             raise NameError(
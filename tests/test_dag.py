@@ -0,0 +1,40 @@
+from snakemake.dag import DAG
+
+
+def dfs(direction, *jobs, **kwargs):
+    # dfs does not access the DAG itself, hence it can be tested on plain dicts
+    return list(DAG.dfs(None, direction, *jobs, **kwargs))
+
+
+# a -> b -> d, a -> c -> d, c -> e
+GRAPH = {"a": ["b", "c"], "b": ["d"], "c": ["d", "e"], "d": [], "e": []}
+
+
+def test_dfs_postorder():
+    assert dfs(GRAPH, "a") == ["d", "b", "e", "c", "a"]
+
+
+def test_dfs_preorder():
+    assert dfs(GRAPH, "a", post=False) == ["a", "b", "d", "c", "e"]
+
+
+def test_dfs_multiple_roots():
+    # each job is yielded only once, also if it is given as a root again
+    assert dfs(GRAPH, "c", "a", "c") == ["d", "e", "c", "b", "a"]
+    assert dfs(GRAPH, "c", "a", post=False) == ["c", "d", "e", "a", "b"]
+
+
+def test_dfs_stop():
+    # stopped jobs are neither yielded nor descended into
+    stop = lambda job: job == "c"
+    assert dfs(GRAPH, "a", stop=stop) == ["d", "b", "a"]
+    assert dfs(GRAPH, "a", stop=stop, post=False) == ["a", "b", "d"]
+    assert dfs(GRAPH, "c", stop=stop) == []
+
+
+def test_dfs_deep():
+    # deep chains must not hit the recursion limit
+    n = 10000
+    chain = {i: [i + 1] for i in range(n)}
+    chain[n] = []
+    assert dfs(chain, 0) == list(range(n, -1, -1))
@@ -791,6 +791,31 @@ def test_pipes_fail():
     run(dpath("test_pipes_fail"), shouldfail=True)
 
 
+def test_many_short_jobs():
+    run(dpath("test_many_short_jobs"), cores=8)
+
+
+@skip_on_windows
+def test_pipes_group_workers():
+    # the group job needs more workers than available by default
+    run(dpath("test_pipes_group_workers"), cores=1)
+
+
+def test_prepare_fail():
+    # Errors while preparing a job abort the workflow instead of being
+    # treated as failures of the job, which would let the independent job
+    # run because of --keep-going.
+    tmpdir = run(
+        dpath("test_prepare_fail"),
+        cores=1,
+        keepgoing=True,
+        shouldfail=True,
+        cleanup=False,
+    )
+    assert not os.path.exists(os.path.join(tmpdir, "independent.out"))
+    shutil.rmtree(tmpdir)
+
+
 def test_validate():
     run(dpath("test_validate"))
 